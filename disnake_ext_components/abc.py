@@ -20,6 +20,9 @@ P = ParamSpec("P")
 
 ListenerT = t.TypeVar("ListenerT", bound="BaseListener[t.Any, t.Any, t.Any]")
 
+MAX_CUSTOM_ID_LENGTH: t.Final[int] = 100
+"""The maximum length of a `custom_id`, as enforced by Discord."""
+
 
 class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
 
@@ -60,10 +63,11 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
     Only applicable if custom regex has not been set. If it has, this will be `None` instead.
     """
 
-    params: t.List[params.ParamInfo]
-    """A list that contains processed listener function parameters with `self` and the
+    params: t.Tuple[params.ParamInfo, ...]
+    """A tuple that contains processed listener function parameters with `self` and the
     `disnake.MessageInteraction` parameter stripped off. These parameters contain extra information
-    about their regex pattern(s) and converter(s).
+    about their regex pattern(s) and converter(s). These are frozen in declaration order, such
+    that they line up with the values parsed from a `custom_id`.
     """
 
     checks: t.List[types_.CheckCallback[types_.InteractionT]]
@@ -86,6 +90,7 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
         self.name = name
         self.__name__ = callback.__name__
         self._signature = commands.params.signature(callback)  # type: ignore
+        self._special_params, self._listener_params = utils.extract_listener_params(self._signature)
 
         if regex:
             self.regex = utils.ensure_compiled(regex)
@@ -94,7 +99,7 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
 
         else:
             self.regex = None
-            self.id_spec = utils.id_spec_from_signature(self.name or "", sep, self._signature)
+            self.id_spec = utils.id_spec_from_params(self.name or "", sep, self._listener_params)
             self.sep = sep
 
     def __get__(self: ListenerT, instance: t.Optional[t.Any], _) -> ListenerT:
@@ -143,6 +148,19 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
 
             return tuple(params.values())
 
+        if self.name and not self.params:
+            # Without params the custom_id must be exactly the name, so there is nothing to split.
+            if custom_id != self.name:
+                raise ValueError(
+                    f"Listener spec {self.id_spec} did not match custom_id {custom_id}."
+                )
+            return ()
+
+        # Every listener receives every interaction of its type, so cheaply reject custom_ids that
+        # were made for a different listener before splitting them.
+        if self.name and not custom_id.startswith(self.name):
+            raise ValueError(f"Listener spec {self.id_spec} did not match custom_id {custom_id}.")
+
         name, *params = custom_id.split(self.sep)
         # If no name is set, skip name check. Otherwise, assure stored and provided name are equal.
         # Also confirm the number of incoming params matches the number of params on the listener.
@@ -151,6 +169,23 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
 
         return tuple(params)
 
+    async def _convert_custom_id_params(
+        self, inter: types_.InteractionT, custom_id_params: t.Sequence[str]
+    ) -> t.Dict[str, t.Any]:
+        """For internal use only. Convert the parameters parsed from a custom_id to the types the
+        listener's parameters are annotated with, in declaration order.
+        """
+        converted: t.Dict[str, t.Any] = {}
+        for param, arg in zip(self.params, custom_id_params):
+            converted[param.name] = await param.convert(
+                arg,
+                inter=inter,
+                converted=list(converted.values()),
+                skip_validation=bool(self.regex),
+            )
+
+        return converted
+
     async def build_custom_id(self, *args: P.args, **kwargs: P.kwargs) -> str:
         """Build a custom_id by passing values for the listener's parameters. This way, assuming
         the values entered are valid according to the listener's typehints, the custom_id is
@@ -167,16 +202,44 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
         **kwargs: :class:`Any`
             Any of the args as mentioned above can also be passed as keyword arguments.
 
+        Raises
+        ------
+        ValueError:
+            The resulting custom_id is longer than Discord allows.
+
         Returns
         -------
         :class:`str`
             A custom_id matching the spec of this listener.
         """
+        if not self.params and self.regex is None:
+            # Without custom_id params the custom_id never changes, so skip serialization entirely.
+            custom_id = self.id_spec
+        else:
+            custom_id = await self._serialize_custom_id(args, kwargs)
+
+        if not custom_id:  # Fallback in case the listener has neither a name nor params.
+            custom_id = self.__name__
+
+        if len(custom_id) > MAX_CUSTOM_ID_LENGTH:
+            # Fail here rather than when Discord rejects the component somewhere down the line.
+            raise ValueError(
+                f"custom_id {custom_id!r} is {len(custom_id)} characters long, which exceeds the"
+                f" maximum of {MAX_CUSTOM_ID_LENGTH} characters."
+            )
+        return custom_id
+
+    async def _serialize_custom_id(
+        self, args: t.Sequence[t.Any], kwargs: t.Dict[str, t.Any]
+    ) -> str:
+        """For internal use only. Serialize the provided values for the listener's parameters and
+        insert them into the custom_id spec.
+        """
         if args:
             # Change args into kwargs such that they're accepted by str.format
-            args_as_kwargs: t.Dict[str, t.Any] = dict(
-                zip([param.name for param in self.params], args)
-            )
+            args_as_kwargs: t.Dict[str, t.Any] = {
+                param.name: arg for param, arg in zip(self.params, args)
+            }
 
             if overlap := kwargs.keys() & args_as_kwargs:
                 # Emulate standard python behaviour by disallowing duplicate names for args/kwargs.
@@ -192,13 +255,11 @@ class BaseListener(abc.ABC, t.Generic[P, T, types_.InteractionT]):
             for param in self.params
         }
 
-        if self.regex:
-            custom_id = self.id_spec.format(**serialized_kwargs)
-        custom_id = self.id_spec.format(sep=self.sep, **serialized_kwargs)
+        if self.sep is None:  # Custom regex, so the spec has to be formatted.
+            return self.id_spec.format(**serialized_kwargs)
 
-        if not custom_id:  # Fallback in case the listener has neither a name nor params.
-            return self.__name__
-        return custom_id
+        # Automatic specs are always the name followed by the params; just join them.
+        return self.sep.join([self.name or "", *serialized_kwargs.values()])
 
     def add_check(self, callback: types_.CheckT) -> types_.CheckT:
         """Add a check to the listener. Like `commands.check` checks, these checks must
@@ -179,7 +179,7 @@ async def message_converter(
     async def _underlying(channel: disnake.abc.Messageable) -> t.Optional[disnake.Message]:
         return await channel.fetch_message(id)
 
-    entries = {inter.channel}.union(converted or {})
+    entries = {inter.channel}.union(converted or ())
     for entry in entries:
         if not isinstance(entry, disnake.abc.Messageable):
             continue
@@ -225,7 +225,7 @@ async def member_converter(
             member = await guild.fetch_member(id)
         return member
 
-    entries = {inter.guild}.union(converted or {})
+    entries = {inter.guild}.union(converted or ())
     for entry in entries:
         if not isinstance(entry, disnake.Guild):
             continue
@@ -272,7 +272,7 @@ async def role_converter(
             role = next((role for role in all_roles if role.id == id), None)
         return role
 
-    entries = {inter.guild}.union(converted or {})
+    entries = {inter.guild}.union(converted or ())
     for entry in entries:
         if not isinstance(entry, disnake.Guild):
             continue
@@ -128,7 +128,7 @@ class ButtonListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
     ) -> None:
         super().__init__(callback, name=name, regex=regex, sep=sep)
 
-        special_params, listener_params = utils.extract_listener_params(self._signature)
+        special_params, listener_params = self._special_params, self._listener_params
 
         if special_params:
             raise TypeError(
@@ -136,7 +136,7 @@ class ButtonListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
                 f"{len(special_params)}. Please confirm you didn't forget the `*,` in the callback."
             )
 
-        self.params = [params.ParamInfo.from_param(param) for param in listener_params]
+        self.params = tuple(params.ParamInfo.from_param(param) for param in listener_params)
         self.reference = self._choose_optimal_reference(reference)
 
     def _choose_optimal_reference(
@@ -190,17 +190,11 @@ class ButtonListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         except ValueError:
             return
 
-        if not await utils.assert_all_checks(self.checks, inter):
+        # Most listeners have no checks, so avoid creating a coroutine just to await nothing.
+        if self.checks and not await utils.assert_all_checks(self.checks, inter):
             return
 
-        converted: t.Dict[str, t.Any] = {}
-        for param, arg in zip(self.params, custom_id_params):
-            converted[param.name] = await param.convert(
-                arg,
-                inter=inter,
-                converted=list(converted.values()),
-                skip_validation=bool(self.regex),
-            )
+        converted = await self._convert_custom_id_params(inter, custom_id_params)
 
         return await super().__call__(inter, **converted)
 
@@ -345,6 +339,8 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
     reference: types_.AbstractComponent
     """A reference component used to set default values in `~.build_component`."""
 
+    _literal_options: t.Optional[t.Tuple[str, ...]]
+
     def __init__(
         self,
         callback: SelectListenerCallback[ParentT, P, T],
@@ -356,8 +352,8 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
     ) -> None:
         super().__init__(callback, name=name, regex=regex, sep=sep)
 
-        special_params, listener_params = utils.extract_listener_params(self._signature)
-        self.params = [params.ParamInfo.from_param(param) for param in listener_params]
+        special_params, listener_params = self._special_params, self._listener_params
+        self.params = tuple(params.ParamInfo.from_param(param) for param in listener_params)
 
         if len(special_params) > 1:
             raise TypeError(
@@ -367,16 +363,26 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
 
         if special_params:
             self.select_param = params.ParamInfo.from_param(param := special_params[0])
-            self.reference = self._choose_optimal_reference(reference, param)
+
+            # Options parsed from `typing.Literal` only depend on the annotation, so we only
+            # need to parse them once instead of on every call to `build_component`.
+            if types_.get_origin(param.annotation) is t.Literal:
+                self._literal_options = tuple(str(arg) for arg in types_.get_args(param.annotation))
+            else:
+                self._literal_options = None
+
+            self.reference = self._choose_optimal_reference(reference, param, self._literal_options)
 
         else:
             self.select_param = None
-            self.reference = self._choose_optimal_reference(reference, None)
+            self._literal_options = None
+            self.reference = self._choose_optimal_reference(reference, None, None)
 
     def _choose_optimal_reference(
         self,
         component: t.Optional[SelectReference],
         param: t.Optional[inspect.Parameter],
+        literal_options: t.Optional[t.Tuple[str, ...]],
     ) -> types_.AbstractComponent:
         if component is not None:  # Manually provided takes highest priority
             if isinstance(component, types_.AbstractComponent):
@@ -384,12 +390,10 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
             return types_.AbstractComponent.from_component(component)
 
         if param is not None and isinstance(default := param.default, types_.AbstractComponent):
-            if not default.get("options") and types_.get_origin(param.annotation) is t.Literal:
+            if not default.get("options") and literal_options:
                 # No options were defined in the AbstractComponent but the parameter was
                 # annotated as literal, thus we should infer the options from the parameter.
-                return default.with_overrides(
-                    options=[str(arg) for arg in types_.get_args(param.annotation)]
-                )
+                return default.with_overrides(options=literal_options)
 
             return default
 
@@ -435,18 +439,11 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         except ValueError:
             return
 
-        if not await utils.assert_all_checks(self.checks, inter):
+        if self.checks and not await utils.assert_all_checks(self.checks, inter):
             return
 
         # First convert custom_id params...
-        converted: t.Dict[str, t.Any] = {}
-        for param, arg in zip(self.params, custom_id_params):
-            converted[param.name] = await param.convert(
-                arg,
-                inter=inter,
-                converted=list(converted.values()),
-                skip_validation=bool(self.regex),
-            )
+        converted = await self._convert_custom_id_params(inter, custom_id_params)
 
         # User didn't supply select params, can still be accessed through inter.values; return.
         if self.select_param is None:
@@ -464,7 +461,9 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         placeholder: t.Optional[str] = None,
         min_values: t.Optional[int] = None,
         max_values: t.Optional[int] = None,
-        options: t.Union[t.List[disnake.SelectOption], t.List[str], t.Dict[str, str], None] = None,
+        options: t.Union[
+            t.Sequence[disnake.SelectOption], t.Sequence[str], t.Dict[str, str], None
+        ] = None,
         disabled: t.Optional[bool] = None,
         *args: P.args,
         **kwargs: P.kwargs,
@@ -485,13 +484,9 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         :class:`disnake.ui.Select`
             The newly created select.
         """
-        if self.select_param:
-            # We need the underlying `inspect.Parameter` here...
-            param = self.select_param.param
-
-            # Parse options from `typing.Literal` if none were provided.
-            if options is None and types_.get_origin(param.annotation) is t.Literal:
-                options = [str(arg) for arg in types_.get_args(param.annotation)]
+        # Use options parsed from `typing.Literal` if none were provided.
+        if options is None:
+            options = self._literal_options
 
         return self.reference.with_overrides(
             placeholder=placeholder,
@@ -508,7 +503,9 @@ class SelectListener(abc.BaseListener[P, T, disnake.MessageInteraction]):
         placeholder: t.Optional[str] = None,
         min_values: t.Optional[int] = None,
         max_values: t.Optional[int] = None,
-        options: t.Union[t.List[disnake.SelectOption], t.List[str], t.Dict[str, str], None] = None,
+        options: t.Union[
+            t.Sequence[disnake.SelectOption], t.Sequence[str], t.Dict[str, str], None
+        ] = None,
         disabled: t.Optional[bool] = None,
         *args: P.args,
         **kwargs: P.kwargs,
@@ -594,7 +591,7 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
 
     __cog_listener_names__: t.List[types_.ListenerType] = [types_.ListenerType.MODAL]
 
-    modal_params: t.List[params.ParamInfo]
+    modal_params: t.Tuple[params.ParamInfo, ...]
     """The parameters with which the user-entered value(s) will be parsed. The values will be
     converted to match the type annotations of these parameters.
     """
@@ -609,7 +606,7 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
     ) -> None:
         super().__init__(callback, name=name, regex=regex, sep=sep)
 
-        special_params, listener_params = utils.extract_listener_params(self._signature)
+        special_params, listener_params = self._special_params, self._listener_params
 
         if not 1 <= len(special_params) <= 5:
             raise TypeError(
@@ -617,9 +614,9 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
                 f"keyword-only argument separator (`*,`), got {len(special_params)}."
             )
 
-        self.params = [params.ParamInfo.from_param(param) for param in listener_params]
-        self.modal_params = [params.ParamInfo.from_param(param) for param in special_params]
-        self.field_ids = [param.name for param in special_params]
+        self.params = tuple(params.ParamInfo.from_param(param) for param in listener_params)
+        self.modal_params = tuple(params.ParamInfo.from_param(param) for param in special_params)
+        self.field_ids = tuple(param.name for param in special_params)
 
     async def __call__(  # pyright: ignore
         self,
@@ -649,7 +646,7 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
         if args or kwargs:
             return await super().__call__(inter, *args, **kwargs)
 
-        if list(inter.text_values) != self.field_ids:
+        if tuple(inter.text_values) != self.field_ids:
             return
 
         try:
@@ -657,17 +654,10 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
         except ValueError:
             return
 
-        if not await utils.assert_all_checks(self.checks, inter):
+        if self.checks and not await utils.assert_all_checks(self.checks, inter):
             return
 
-        converted: t.Dict[str, t.Any] = {}
-        for param, arg in zip(self.params, custom_id_params):
-            converted[param.name] = await param.convert(
-                arg,
-                inter=inter,
-                converted=list(converted.values()),
-                skip_validation=bool(self.regex),
-            )
+        converted = await self._convert_custom_id_params(inter, custom_id_params)
 
         for param, field_id in zip(self.modal_params, self.field_ids):
             converted[param.name] = await param.convert(
@@ -712,10 +702,6 @@ class ModalListener(abc.BaseListener[P, T, disnake.ModalInteraction]):
 
             components = []
             for param, custom_id in zip(self.modal_params, self.field_ids):
-
-                if not isinstance(modal_value := param.param.default, params._ModalValue):
-                    modal_value = params._ModalValue()
-
                 if isinstance(modal_value := param.param.default, params._ModalValue):
                     placeholder = modal_value.placeholder
                     style = modal_value.style
@@ -838,6 +824,19 @@ def modal_listener(
     return wrapper
 
 
+_LISTENERS_BY_COMPONENT: t.Dict[type, t.Type[ComponentListener]] = {
+    disnake.Button: ButtonListener,
+    disnake.ui.Button: ButtonListener,
+    disnake.SelectMenu: SelectListener,
+    disnake.ui.Select: SelectListener,
+}
+
+_LISTENERS_BY_COMPONENT_TYPE: t.Dict[disnake.ComponentType, t.Type[ComponentListener]] = {
+    disnake.ComponentType.button: ButtonListener,
+    disnake.ComponentType.select: SelectListener,
+}
+
+
 @t.overload
 def match_component(
     component: t.Union[disnake.Button, disnake.ui.Button[t.Any]],
@@ -951,24 +950,23 @@ def match_component(
         )
 
     if component is not None:
-        if isinstance(component, (disnake.Button, disnake.ui.Button)):
-            listener_class = ButtonListener
-        elif isinstance(
-            component, (disnake.SelectMenu, disnake.ui.Select)
-        ):  # pyright: ignore  # Valid redundancy imo.
-            listener_class = SelectListener
-        else:
+        # Exact type hits the lookup table directly, subclasses fall back to isinstance.
+        listener_class = _LISTENERS_BY_COMPONENT.get(type(component)) or next(
+            (
+                cls
+                for component_class, cls in _LISTENERS_BY_COMPONENT.items()
+                if isinstance(component, component_class)
+            ),
+            None,
+        )
+        if listener_class is None:
             raise TypeError(
                 "Expected `component` to be an instance of disnake.Button, disnake.ui.Button, "
                 f"disnake.SelectMenu or disnake.ui.Select; got {type(component).__name__}."
             )
 
     elif component_type is not None:
-        if component_type is disnake.ComponentType.button:
-            listener_class = ButtonListener
-        elif component_type is disnake.ComponentType.select:
-            listener_class = SelectListener
-        else:
+        if (listener_class := _LISTENERS_BY_COMPONENT_TYPE.get(component_type)) is None:
             raise TypeError(
                 "Expected `component_type` to be either disnake.ComponentType.button or "
                 f"disnake.ComponentType.select; got {component_type.name}."
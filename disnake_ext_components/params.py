@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import enum
+import functools
 import inspect
 import re
 import sys
@@ -54,6 +56,39 @@ REGEX_MAP: t.Dict[type, t.Pattern[str]] = {
 }
 
 
+_SUBCLASSABLE_TYPES: t.Tuple[type, ...] = (str, int, float)
+"""Builtin types whose subclasses are converted by calling the subclass on the argument."""
+
+
+def _get_converters(
+    annotation: t.Any,
+) -> t.Tuple[t.Pattern[str], converter.ConverterSig, converter.ConverterSig]:
+    """Get the regex pattern and the converters to and from strings for a type annotation.
+
+    Subclasses of :class:`str`, :class:`int` and :class:`float` that are not registered themselves
+    reuse the pattern of their base type, but are converted by calling the subclass itself, such
+    that the result is an instance of the annotated type. Enums are excluded, as their members are
+    neither constructed from nor serialized to the same strings as their base type.
+
+    Subclasses of any other registered type (e.g. :class:`disnake.TextChannel` or
+    :class:`disnake.Permissions`) are deliberately not resolved through their MRO: the converters
+    of the base type would return instances of the base type rather than of the annotated
+    subclass. These raise a :class:`KeyError` like any other unregistered type.
+    """
+    if (
+        annotation not in converter.CONVERTER_MAP
+        and isinstance(annotation, type)
+        and not issubclass(annotation, enum.Enum)
+    ):
+        for base in _SUBCLASSABLE_TYPES:
+            if issubclass(annotation, base):
+                conv_to = t.cast(converter.ConverterSig, annotation)
+                return REGEX_MAP[base], conv_to, converter.CONVERTER_MAP[base][1]
+
+    conv_to, conv_from = converter.CONVERTER_MAP[annotation]
+    return REGEX_MAP[annotation], conv_to, conv_from
+
+
 class ParamInfo:
     """Helper class that stores information about a listener parameter. Mainly instantiated
     through `ParamInfo.from_param`. Contains the conversion strategy used to convert input
@@ -150,8 +185,8 @@ class ParamInfo:
             return self._parse_converted(annotation)
 
         if not (origin := types_.get_origin(annotation)):
-            conv_to, conv_from = converter.CONVERTER_MAP[annotation]
-            return [REGEX_MAP[annotation]], ([conv_to], [conv_from])
+            regex, conv_to, conv_from = _get_converters(annotation)
+            return [regex], ([conv_to], [conv_from])
 
         elif origin in _UnionTypes:
             return self._parse_union(annotation)
@@ -208,7 +243,7 @@ class ParamInfo:
 
             for arg in types_.get_args(annotation):
                 regex.append(re.compile(re.escape(str(arg))))
-                arg_conv_to, arg_conv_from = converter.CONVERTER_MAP[type(arg)]
+                _, arg_conv_to, arg_conv_from = _get_converters(type(arg))
                 conv_to.append(arg_conv_to)
                 conv_from.append(arg_conv_from)
 
@@ -246,20 +281,49 @@ class ParamInfo:
         """The name of the parameter."""
         return self.param.name
 
-    @property
+    @functools.cached_property
     def container_type(self) -> t.Optional[type]:
         """The container type, if any. For example, a parameter annotated as ``List[str]``
-        would have container type ``list``.
+        would have container type ``list``. This is resolved once and cached, as it is needed on
+        every conversion.
         """
         annotation = self.param.annotation
         origin = t.get_origin(annotation) or annotation
         try:
-            if issubclass(origin, t.Collection) and origin not in {str, bytes}:
+            if issubclass(origin, t.Collection) and not issubclass(origin, (str, bytes)):
                 return t.cast(type, origin)
         except TypeError:
             pass
         return None
 
+    @functools.cached_property
+    def _converters_to_info(
+        self,
+    ) -> t.Tuple[t.Tuple[converter.ConverterSig, t.FrozenSet[str], bool], ...]:
+        """For internal use only. The converters in `converters_to`, each alongside the names of
+        the parameters it accepts and whether it is a coroutine function. These are determined
+        once, rather than inspecting the converter on every conversion.
+        """
+        return tuple(
+            (
+                conv,
+                frozenset(
+                    params.signature(  # pyright: ignore
+                        conv.__new__ if isinstance(conv, type) else conv
+                    ).parameters
+                ),
+                inspect.iscoroutinefunction(conv),
+            )
+            for conv in self.converters_to
+        )
+
+    @functools.cached_property
+    def _converters_from_info(self) -> t.Tuple[t.Tuple[converter.ConverterSig, bool], ...]:
+        """For internal use only. The converters in `converters_from`, each alongside whether it is
+        a coroutine function.
+        """
+        return tuple((conv, inspect.iscoroutinefunction(conv)) for conv in self.converters_from)
+
     @t.overload
     async def convert(self, argument: str, **kwargs: t.Any) -> t.Any:
         ...
@@ -301,21 +365,29 @@ class ParamInfo:
         if not isinstance(argument, str):
             if not self.container_type:
                 if len(argument) == 1:
-                    return await self.convert(argument[0], **kwargs)
+                    return await self._convert_single(argument[0], **kwargs)
 
                 exc = ValueError("Cannot convert a list of arguments to a non-collection type.")
                 raise exceptions.ConversionError(
                     f"Failed to convert parameter {self.param.name}", self.param, [exc]
                 )
 
-            converted = [result for arg in argument for result in await self.convert(arg, **kwargs)]
+            # Collect all values into a single container rather than wrapping each value.
+            converted = [await self._convert_single(arg, **kwargs) for arg in argument]
             return self.container_type(converted)
 
+        converted = await self._convert_single(argument, **kwargs)
+        return self.container_type([converted]) if self.container_type else converted
+
+    async def _convert_single(self, argument: str, **kwargs: t.Any) -> t.Any:
+        """For internal use only. Convert a single argument without wrapping it in the container
+        type of the parameter.
+        """
         method = self._convert_and_validate if self.regex else self._convert_raw
         converted, errors = await method(argument, **kwargs)
 
         if not errors or self.optional:
-            return self.container_type([converted]) if self.container_type else converted
+            return converted
 
         raise exceptions.ConversionError(
             f"Failed to convert parameter {self.param.name}", self.param, errors
@@ -327,9 +399,9 @@ class ParamInfo:
         """For internal use only. Run converters on an argument without regex validation."""
         errors: t.List[ValueError] = []
 
-        for conv in self.converters_to:
+        for conv, accepted, is_async in self._converters_to_info:
             try:
-                return await self._actual_conversion(argument, conv, **kwargs)
+                return await self._actual_conversion(argument, conv, accepted, is_async, **kwargs)
             except ValueError as exc:
                 errors.append(exc)
 
@@ -344,7 +416,7 @@ class ParamInfo:
         match_cache: t.Set[t.Pattern[str]] = set()  # Prevent matching the same regex again.
         errors: t.List[ValueError] = []
 
-        for regex, conv in zip(self.regex, self.converters_to):
+        for regex, (conv, accepted, is_async) in zip(self.regex, self._converters_to_info):
             if regex not in match_cache:
                 if regex.fullmatch(argument):
                     match_cache.add(regex)
@@ -359,7 +431,7 @@ class ParamInfo:
                     continue
 
             try:
-                return await self._actual_conversion(argument, conv, **kwargs)
+                return await self._actual_conversion(argument, conv, accepted, is_async, **kwargs)
             except ValueError as exc:
                 errors.append(exc)
 
@@ -369,31 +441,30 @@ class ParamInfo:
         self,
         argument: str,
         conv: converter.ConverterSig,
+        accepted: t.FrozenSet[str],
+        is_async: bool,
         **kwargs: t.Any,
     ) -> t.Tuple[t.Any, t.List[ValueError]]:
         """For internal use only. Actually run a converter on an argument and return the result.
         Raises whatever the converter function may raise. Generally speaking, this should only be
         :class:`ValueError`s.
         """
-        converter_signature = params.signature(  # pyright: ignore
-            conv.__new__ if isinstance(conv, type) else conv
-        ).parameters
-
         converted = conv(
             argument,
-            **{key: value for key, value in kwargs.items() if key in converter_signature},
+            **{key: value for key, value in kwargs.items() if key in accepted},
         )
 
-        if inspect.isawaitable(converted):
+        # Results of coroutine functions are always awaitable, so only check other converters.
+        if is_async or inspect.isawaitable(converted):
             return await converted, []
         return converted, []
 
     async def to_str(self, argument: t.Any) -> str:
         errors: t.List[ValueError] = []
-        for conv in self.converters_from:
+        for conv, is_async in self._converters_from_info:
             try:
                 converted = conv(argument)
-                if inspect.isawaitable(converted):
+                if is_async or inspect.isawaitable(converted):
                     return await converted
                 return converted  # type: ignore  # Type not correctly narrowed.
 
@@ -406,6 +477,8 @@ class ParamInfo:
 
 
 class _SelectValue:
+    __slots__ = ("placeholder", "min_values", "max_values", "options", "disabled")
+
     def __init__(
         self,
         placeholder: t.Optional[str] = None,
@@ -469,6 +542,16 @@ def SelectValue(
 
 
 class _ModalValue:
+    __slots__ = (
+        "placeholder",
+        "label",
+        "value",
+        "required",
+        "min_length",
+        "max_length",
+        "style",
+    )
+
     def __init__(
         self,
         placeholder: t.Optional[str] = None,
@@ -179,7 +179,7 @@ class SelectOption(disnake.SelectOption):
 
 
 def _parse_select_options(
-    options: t.Union[t.List[disnake.SelectOption], t.List[str], t.Dict[str, str]]
+    options: t.Union[t.Sequence[disnake.SelectOption], t.Sequence[str], t.Dict[str, str]]
 ) -> t.List[SelectOption]:
     # Had to yoink this from disnake as the `ui.select` module is shadowed by the decorator...
     # Gave me the opportunity to work with custom SelectOptions that support comparison though.
@@ -207,11 +207,11 @@ class AbstractComponent:
 
     def __init__(self, **kwargs: t.Any):
         # Handle special cases...
-        if "emoji" in kwargs and isinstance(emoji := kwargs["emoji"], str):
+        if isinstance(emoji := kwargs.get("emoji"), str):
             kwargs["emoji"] = disnake.PartialEmoji.from_str(emoji)
 
         if "options" in kwargs:
-            kwargs["options"] = _parse_select_options(kwargs["options"] or [])
+            kwargs["options"] = _parse_select_options(kwargs["options"] or ())
 
         for k, v in kwargs.items():
             setattr(self, k, v)
@@ -258,9 +258,10 @@ class AbstractComponent:
         return AbstractComponent(**dict(self))
 
     def with_overrides(self, **kwargs: t.Any):
-        copy = self.copy()
-        copy.__init__(**{k: v for k, v in kwargs.items() if v is not None})
-        return copy
+        # Merge the overrides in before construction so the copy is only initialised once.
+        merged = dict(self)
+        merged.update((k, v) for k, v in kwargs.items() if v is not None)
+        return AbstractComponent(**merged)
 
     def as_component(self, template: t.Type[MessageComponentT]) -> MessageComponentT:
         kwargs = dict(self)
@@ -9,11 +9,15 @@ from . import types_
 
 __all__ = [
     "id_spec_from_signature",
+    "id_spec_from_params",
     "id_spec_from_regex",
     "extract_listener_params",
     "ensure_compiled",
 ]
 
+_NAMED_GROUP_PATTERN: t.Pattern[str] = re.compile(r"\(\?P<(.+?)>.*?\)")
+"""Matches named capture groups in a custom_id regex pattern, used to build an id spec."""
+
 
 def id_spec_from_signature(name: str, sep: str, signature: inspect.Signature) -> str:
     """Analyze a function signature to create a format string for creating new custom_ids.
@@ -31,10 +35,31 @@ def id_spec_from_signature(name: str, sep: str, signature: inspect.Signature) ->
         The custom_id spec that was built from the provided function signature.
     """
     _, custom_id_params = extract_listener_params(signature)
-    if not custom_id_params:
+    return id_spec_from_params(name, sep, custom_id_params)
+
+
+def id_spec_from_params(name: str, sep: str, params: t.Sequence[inspect.Parameter]) -> str:
+    """Create a format string for creating new custom_ids from the custom_id parameters of a
+    listener function, as extracted by `extract_listener_params`.
+
+    Parameters
+    ----------
+    name: :class:`str`
+        The name of the listener function to which the parameters belong.
+    sep: :class:`str`
+        The symbol(s) used to separate individual components of the `custom_id`.
+    params: Sequence[:class:`inspect.Parameter`]
+        The custom_id parameters of the listener function.
+
+    Returns
+    -------
+    :class:`str`
+        The custom_id spec that was built from the provided parameters.
+    """
+    if not params:
         return name
 
-    return name + sep + sep.join(f"{{{param.name}}}" for param in custom_id_params)
+    return name + sep + sep.join(f"{{{param.name}}}" for param in params)
 
 
 def id_spec_from_regex(regex: t.Pattern[str]) -> str:
@@ -51,7 +76,7 @@ def id_spec_from_regex(regex: t.Pattern[str]) -> str:
     :class:`str`
         The custom_id spec that was extracted from the regex pattern.
     """
-    return re.sub(r"\(\?P<(.+?)>.*?\)", lambda m: f"{{{m[1]}}}", regex.pattern)
+    return _NAMED_GROUP_PATTERN.sub(lambda m: f"{{{m[1]}}}", regex.pattern)
 
 
 def extract_listener_params(
@@ -70,6 +70,148 @@ def test_listener_name_override_modal():
     assert this_should_not_show_up.name == override
 
 
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    "listener_decorator",
+    [components.button_listener, components.select_listener],
+)
+async def test_build_custom_id_no_params(listener_decorator: ListenerBuilder):
+    @listener_decorator()
+    async def callback(inter: disnake.MessageInteraction):
+        pass
+
+    assert await callback.build_custom_id() == "callback"
+
+    @listener_decorator(name="")
+    async def unnamed(inter: disnake.MessageInteraction):
+        pass
+
+    assert await unnamed.build_custom_id() == "unnamed"
+
+
+@pytest.mark.asyncio()
+async def test_build_custom_id_params():
+    @components.button_listener(sep="|")
+    async def callback(inter: disnake.MessageInteraction, *, foo: int, bar: str):
+        pass
+
+    assert await callback.build_custom_id(1, bar="abc") == "callback|1|abc"
+
+
+@pytest.mark.asyncio()
+async def test_build_custom_id_regex():
+    @components.button_listener(regex=r"callback-(?P<foo>\d+)-(?P<bar>.+)")
+    async def callback(inter: disnake.MessageInteraction, *, foo: int, bar: str):
+        pass
+
+    assert await callback.build_custom_id(1, bar="abc") == "callback-1-abc"
+
+
+@pytest.mark.asyncio()
+async def test_build_custom_id_too_long():
+    @components.button_listener()
+    async def callback(inter: disnake.MessageInteraction, *, foo: str):
+        pass
+
+    assert len(await callback.build_custom_id(foo="a" * 91)) == 100
+
+    with pytest.raises(ValueError, match="exceeds the maximum"):
+        await callback.build_custom_id(foo="a" * 92)
+
+
+@pytest.mark.asyncio()
+async def test_build_custom_id_too_long_no_params():
+    @components.button_listener(name="a" * 101)
+    async def callback(inter: disnake.MessageInteraction):
+        pass
+
+    with pytest.raises(ValueError, match="exceeds the maximum"):
+        await callback.build_custom_id()
+
+
+@pytest.mark.asyncio()
+async def test_build_component_literal_options():
+    @components.select_listener()
+    async def callback(inter: disnake.MessageInteraction, value: t.Literal["a", "b"]):
+        pass
+
+    select = await callback.build_component()
+    assert [option.value for option in select.options] == ["a", "b"]
+
+    select = await callback.build_component(options=["c"])
+    assert [option.value for option in select.options] == ["c"]
+
+
+@pytest.mark.asyncio()
+async def test_build_component_literal_options_select_value():
+    # A SelectValue default without options should infer them from the Literal annotation...
+
+    @components.select_listener()
+    async def callback(
+        inter: disnake.MessageInteraction,
+        value: t.Literal["a", "b"] = components.SelectValue("Pick one"),
+    ):
+        pass
+
+    assert [option.value for option in callback.reference.options] == ["a", "b"]
+
+    select = await callback.build_component()
+    assert select.placeholder == "Pick one"
+    assert [option.value for option in select.options] == ["a", "b"]
+
+    select = await callback.build_component(options=("c", "d"))
+    assert [option.value for option in select.options] == ["c", "d"]
+
+
+@components.button_listener(name="callback")
+async def params_listener(inter: disnake.MessageInteraction, *, foo: int, bar: str):
+    pass
+
+
+@components.button_listener(name="callback")
+async def no_params_listener(inter: disnake.MessageInteraction):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("listener", "custom_id", "expected"),
+    [
+        (params_listener, "callback:1:abc", ("1", "abc")),
+        (params_listener, "callback:1:", ("1", "")),
+        (params_listener, "other:1:abc", None),
+        (params_listener, "callbacks:1:abc", None),
+        (params_listener, "callback:1", None),
+        (params_listener, "callback:1:abc:def", None),
+        (no_params_listener, "callback", ()),
+        (no_params_listener, "callback:", None),
+        (no_params_listener, "callbacks", None),
+        (no_params_listener, "other", None),
+    ],
+)
+def test_parse_custom_id(
+    listener: abc.BaseListener[t.Any, t.Any, t.Any],
+    custom_id: str,
+    expected: t.Optional[t.Tuple[str, ...]],
+):
+    if expected is None:
+        with pytest.raises(ValueError, match="did not match"):
+            listener.parse_custom_id(custom_id)
+    else:
+        assert listener.parse_custom_id(custom_id) == expected
+
+
+def test_match_component_custom_id_with_sep():
+    # A static custom_id containing the separator should still match itself exactly.
+    @components.match_component(disnake.ui.Button(custom_id="foo:bar"))
+    async def callback(inter: disnake.MessageInteraction):
+        pass
+
+    assert callback.parse_custom_id("foo:bar") == ()
+
+    with pytest.raises(ValueError, match="did not match"):
+        callback.parse_custom_id("foo")
+
+
 # TODO: Add tests for match_component naming, though that needs some further work.
 #       Currently, they allow not specifying a name at all, which I doubt actually
 #       offers any useful functionality, and also caused the naming regression.
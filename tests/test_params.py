@@ -1,4 +1,5 @@
 import datetime
+import enum
 import inspect
 import typing as t
 
@@ -254,6 +255,36 @@ async def test_converted_paraminfo(
     assert await paraminfo.to_str(dt) == "0"
 
 
+class MyInt(int):
+    ...
+
+
+class MyStr(str):
+    ...
+
+
+class MyEnum(int, enum.Enum):
+    A = 1
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("annotation", "argument", "expected"),
+    [
+        (MyInt, "1", MyInt(1)),
+        (MyStr, "hello", MyStr("hello")),
+    ],
+)
+async def test_paraminfo_subclass(annotation: t.Type[t.Any], argument: str, expected: t.Any):
+    param = param_from_annotation(annotation)
+    paraminfo = components.params.ParamInfo.from_param(param)
+
+    result = await paraminfo.convert(argument)
+    assert result == expected
+    assert type(result) is annotation
+    assert await paraminfo.to_str(result) == argument
+
+
 # params.ParamInfo | exc
 
 
@@ -263,6 +294,23 @@ def test_fail_converter_map_paraminfo():
         components.params.ParamInfo.from_param(param)
 
 
+def test_fail_converter_map_subclass_paraminfo():
+    # Subclasses of registered non-builtin types are not resolved through their base type...
+
+    class MyPermissions(disnake.Permissions):
+        ...
+
+    param = param_from_annotation(MyPermissions)
+    with pytest.raises(KeyError):
+        components.params.ParamInfo.from_param(param)
+
+
+def test_fail_converter_map_enum_paraminfo():
+    param = param_from_annotation(MyEnum)
+    with pytest.raises(KeyError):
+        components.params.ParamInfo.from_param(param)
+
+
 def test_fail_unsupported_type_paraminfo():
     param = param_from_annotation(t.ClassVar[int])
     with pytest.raises(TypeError):
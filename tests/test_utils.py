@@ -94,6 +94,21 @@ def test_auto_spec_modal(modal_listener_callback: t.Callable[..., t.Any]):
     assert spec == "name|{foo}|{bar}"
 
 
+# utils.id_spec_from_params
+
+
+def test_params_spec(button_listener_callback: t.Callable[..., t.Any]):
+    sig = inspect.signature(button_listener_callback)
+    _, custom_id_params = components.utils.extract_listener_params(sig)
+
+    spec = components.utils.id_spec_from_params("name", "|", custom_id_params)
+    assert spec == components.utils.id_spec_from_signature("name", "|", sig)
+
+
+def test_params_spec_empty():
+    assert components.utils.id_spec_from_params("name", "|", ()) == "name"
+
+
 # utils.id_spec_from_regex
 
 